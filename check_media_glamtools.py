@@ -9,26 +9,85 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from datetime import datetime, timezone
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+from html import unescape
+import atexit
+import base64
+import orjson
 import time
-import json
+import os
 import re
+import shutil
+import stat
+import threading
 
 # Configuration
 GLAMTOOLS_URL = "https://glamtools.toolforge.org/glamorgan.html"
+GLAMTOOLS_ORIGIN = "https://glamtools.toolforge.org"
+# Site state wiped from persistent profiles; the HTTP disk cache is deliberately kept
+CLEARED_STORAGE_TYPES = (
+    "cookies,local_storage,indexeddb,websql,file_systems,service_workers,cache_storage"
+)
 DEPTH = "12"
 # Use previous month to ensure data is available
 
 DEFAULT_MAX_WAIT_SECONDS = 70
 DEFAULT_INITIAL_WAIT_SECONDS = 7
 STABILIZATION_CHECKS = 5
+TABLE_PRESENCE_POLL_SECONDS = 2
+RESULT_ROW_SELECTOR = "#output table.table-striped tr"
+# Reads everything wait_for_results checks in one round-trip; arguments are the
+# RESULT_CATEGORY_LINE_PATTERN and RESULT_VIEWS_PATTERN sources and RESULT_ROW_SELECTOR
+RESULTS_PROBE_SCRIPT = """
+const output = document.getElementById("output");
+const status = document.getElementById("status");
+const outputText = output ? output.innerText : "";
+return {
+    status: status ? status.innerText : "",
+    hasCategoryLine: new RegExp(arguments[0], "i").test(outputText),
+    hasViews: new RegExp(arguments[1], "i").test(outputText),
+    hasTable: !!document.querySelector("#output table.table-striped, #output .table-striped"),
+    rowCount: document.querySelectorAll(arguments[2]).length,
+};
+"""
+RESULTS_STARTED_SCRIPT = """
+const status = document.getElementById("status");
+return Boolean((status && status.innerText.trim()) || document.querySelector(arguments[0]));
+"""
+PAGE_CONTAINS_SCRIPT = "return document.documentElement.outerHTML.includes(arguments[0]);"
 RESULT_CATEGORY_LINE_PATTERN = re.compile(r"\b\d+\s+files in category tree\b", re.IGNORECASE)
 RESULT_VIEWS_PATTERN = re.compile(r"\bfile views in\b", re.IGNORECASE)
+SUMMARY_FILES_PATTERN = re.compile(
+    r"([\d,]+)\s+files were viewed,\s*out of\s*([\d,]+)\s+used", re.IGNORECASE
+)
+SUMMARY_PAGES_PATTERN = re.compile(r"([\d,]+)\s+pages on\s+([\d,]+)\s+wikis", re.IGNORECASE)
+SUMMARY_VIEWS_PATTERN = re.compile(r"([\d,]+)\s+file views", re.IGNORECASE)
+NON_DIGIT_PATTERN = re.compile(r"[^0-9-]")
+# ASCII bytes that bytes.translate strips before int(); everything but digits and "-"
+ASCII_NON_DIGIT_BYTES = bytes(code for code in range(128) if chr(code) not in "0123456789-")
+SCRIPT_STYLE_PATTERN = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+OUTPUT_CONTAINER_PATTERN = re.compile(
+    r"""<[a-z][^>]*\sid\s*=\s*(?:"output"|'output'|output(?=[\s/>]))[^>]*>""", re.IGNORECASE
+)
+RESULT_TABLE_START_PATTERN = re.compile(
+    r"<table\b[^>]*\bclass\s*=\s*[\"'][^\"']*\btable-striped\b[^>]*>", re.IGNORECASE
+)
+RESULT_TABLE_END_PATTERN = re.compile(r"</table\s*>", re.IGNORECASE)
+TABLE_ROW_PATTERN = re.compile(r"<tr\b[^>]*>(.*?)(?=<tr\b|\Z)", re.IGNORECASE | re.DOTALL)
+TABLE_CELL_PATTERN = re.compile(r"<(t[dh])\b[^>]*>(.*?)</\1\s*>", re.IGNORECASE | re.DOTALL)
+ANCHOR_PATTERN = re.compile(r"<a\b([^>]*)>(.*?)</a\s*>", re.IGNORECASE | re.DOTALL)
+HREF_PATTERN = re.compile(r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+COMMONS_FILE_URL_MARKER = "commons.wikimedia.org/wiki/File"
+COMMONS_FILE_LINK_SELECTOR = f'a[href*="{COMMONS_FILE_URL_MARKER}"]'
+# Only build the part of the (often multi-MB) result page the table extractor looks at
+OUTPUT_CONTAINER_STRAINER = SoupStrainer(id="output")
 
 
 @dataclass(frozen=True)
@@ -39,8 +98,75 @@ class CategoryConfig:
     max_wait_seconds: int = DEFAULT_MAX_WAIT_SECONDS
     initial_wait_seconds: int = DEFAULT_INITIAL_WAIT_SECONDS
 
+    @property
+    def output_dir(self) -> Path:
+        return REPORTS_ROOT / self.report_subdir
+
+
+@dataclass(frozen=True)
+class GlamQuery:
+    """Form values for one GLAM Tools request."""
+
+    category: str
+    depth: str
+    year: str
+    month: str
+
+    @property
+    def month_for_form(self) -> str:
+        return str(int(self.month))
+
+
+@dataclass(frozen=True)
+class CategoryRunResult:
+    """Outcome of one category run as listed in run_summary.json."""
+
+    name: str
+    label: str
+    report_directory: str
+    changes: int
+
+    @classmethod
+    def for_report(
+        cls, config: CategoryConfig, output_dir: Path, changes: int
+    ) -> "CategoryRunResult":
+        return cls(
+            name=config.name,
+            label=config.label,
+            report_directory=output_dir.as_posix(),
+            changes=int(changes),
+        )
+
 
 REPORTS_ROOT = Path("reports")
+REPORT_INDEX_PATH = REPORTS_ROOT / ".cache" / "index.json"
+# Bump when the parsed report fields change so stale index entries are ignored
+REPORT_INDEX_VERSION = 2
+REPORT_SCAN_WORKERS = 8
+# Set GLAM_REPARSE=1 to re-extract file entries from stored HTML even when metadata has them
+REPARSE_REPORT_HTML = os.environ.get("GLAM_REPARSE") == "1"
+# Set GLAM_FORCE_REFRESH=1 to query GLAM Tools even if a report younger than RUN_CACHE_TTL exists
+FORCE_REFRESH = os.environ.get("GLAM_FORCE_REFRESH") == "1"
+CHROME_PROFILE_DIR = Path.home() / ".cache" / "glamtools-chrome"
+SCREENSHOT_JPEG_QUALITY = 60
+# Each browser runs one category at a time and waits mostly on GLAM Tools itself
+MAX_PARALLEL_BROWSERS = 2
+# Reuse a report for the same query instead of starting the browser when it is this recent
+RUN_CACHE_TTL = timedelta(hours=6)
+# Resources the results page never needs; stylesheets stay so the page still lays out
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*googletagmanager*",
+    "*google-analytics*",
+]
 CATEGORY_CONFIGS: List[CategoryConfig] = [
     CategoryConfig(
         name="Media supplied by Universitätsarchiv St. Gallen",
@@ -72,30 +198,58 @@ CATEGORY_CONFIGS: List[CategoryConfig] = [
     ),
 ]
 
-CATEGORY = CATEGORY_CONFIGS[0].name
-
 
 def previous_month(year: int, month: int) -> Tuple[int, int]:
-    if month == 1:
-        return year - 1, 12
-    return year, month - 1
+    last_day = date(year, month, 1) - timedelta(days=1)
+    return last_day.year, last_day.month
+
+
+def months_back(year: int, month: int, count: int) -> List[Tuple[int, int]]:
+    """Return the count months before year/month, most recent first."""
+    months: List[Tuple[int, int]] = []
+    for _ in range(count):
+        year, month = previous_month(year, month)
+        months.append((year, month))
+    return months
 
 
 current_date = datetime.now(timezone.utc)
 target_year, target_month = previous_month(current_date.year, current_date.month)
 YEAR = f"{target_year}"
 MONTH = f"{target_month:02d}"
-MONTH_FOR_FORM = str(target_month)
 IS_FIRST_DAY_OF_MONTH = current_date.day == 1
 PREVIOUS_DATASET_YEAR, PREVIOUS_DATASET_MONTH = previous_month(target_year, target_month)
-BASE_OUTPUT_DIR = REPORTS_ROOT / CATEGORY_CONFIGS[0].report_subdir
+# Categories run in parallel workers; each worker tags its output with the category label
+LOG_CONTEXT = threading.local()
+LOG_LOCK = threading.Lock()
+REPORT_INDEX: Optional[Dict[str, Any]] = None
+REPORT_INDEX_DIRTY = False
+REPORT_INDEX_LOCK = threading.Lock()
+
+
+def log(message: str = "") -> None:
+    """Print a progress message, prefixed with the current worker's category label."""
+    label = getattr(LOG_CONTEXT, "label", None)
+    if label:
+        message = "\n".join(
+            f"[{label}] {line}" if line else line for line in message.split("\n")
+        )
+    with LOG_LOCK:
+        print(message, flush=True)
 
 
 def parse_int(value: str) -> Optional[int]:
     """Convert a numeric string with separators to int."""
     if value is None:
         return None
-    digits = re.sub(r"[^0-9-]", "", value)
+    # Most cells are plain or comma-grouped counts such as "1,234"
+    plain = value.replace(",", "")
+    if plain.isdigit() and plain.isascii():
+        return int(plain)
+    if value.isascii():
+        digits = value.encode("ascii").translate(None, ASCII_NON_DIGIT_BYTES)
+    else:
+        digits = NON_DIGIT_PATTERN.sub("", value)
     if not digits:
         return None
     try:
@@ -104,9 +258,21 @@ def parse_int(value: str) -> Optional[int]:
         return None
 
 
+def html_to_text(html: str) -> str:
+    """Strip scripts, styles and tags from HTML and decode entities."""
+    text = SCRIPT_STYLE_PATTERN.sub(" ", html)
+    text = HTML_TAG_PATTERN.sub(" ", text)
+    return unescape(text)
+
+
+def find_output_start(html: str) -> Optional[int]:
+    """Return the offset just after the opening tag of the #output container."""
+    match = OUTPUT_CONTAINER_PATTERN.search(html)
+    return match.end() if match else None
+
+
 def extract_summary_stats_from_html(html: str) -> Dict[str, Optional[int]]:
-    """Extract summary statistics (files, pages, views) from the HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+    """Extract summary statistics (files, pages, views) from the #output section."""
     stats: Dict[str, Optional[int]] = {
         "files_viewed": None,
         "files_used": None,
@@ -114,45 +280,148 @@ def extract_summary_stats_from_html(html: str) -> Dict[str, Optional[int]]:
         "wikis": None,
         "views": None,
     }
+    output_start = find_output_start(html)
+    if output_start is None:
+        return stats
+    # Only GLAM Tools' own result lines count, not similar text elsewhere on the page
+    text = html_to_text(html[output_start:])
+
+    match = SUMMARY_FILES_PATTERN.search(text)
+    if match:
+        stats["files_viewed"] = parse_int(match.group(1))
+        stats["files_used"] = parse_int(match.group(2))
+
+    match = SUMMARY_PAGES_PATTERN.search(text)
+    if match:
+        stats["pages_used"] = parse_int(match.group(1))
+        stats["wikis"] = parse_int(match.group(2))
+
+    match = SUMMARY_VIEWS_PATTERN.search(text)
+    if match:
+        stats["views"] = parse_int(match.group(1))
 
-    files_pattern = re.compile(
-        r"([\d,]+)\s+files were viewed,\s*out of\s*([\d,]+)\s+used",
-        re.IGNORECASE,
-    )
-    pages_pattern = re.compile(
-        r"([\d,]+)\s+pages on\s+([\d,]+)\s+wikis", re.IGNORECASE
-    )
-    views_pattern = re.compile(r"([\d,]+)\s+file views", re.IGNORECASE)
+    return stats
 
-    for div in soup.find_all("div"):
-        text = div.get_text(" ", strip=True)
-        if not text:
-            continue
 
-        if stats["files_viewed"] is None:
-            match = files_pattern.search(text)
-            if match:
-                stats["files_viewed"] = parse_int(match.group(1))
-                stats["files_used"] = parse_int(match.group(2))
+def fragment_text(fragment: str) -> str:
+    """Return the text of an HTML fragment like BeautifulSoup's get_text(strip=True).
 
-        if stats["pages_used"] is None:
-            match = pages_pattern.search(text)
-            if match:
-                stats["pages_used"] = parse_int(match.group(1))
-                stats["wikis"] = parse_int(match.group(2))
+    Each text piece between tags is stripped on its own and the pieces are joined
+    without a separator, so usage keys match reports parsed with BeautifulSoup.
+    """
+    return "".join(unescape(piece).strip() for piece in HTML_TAG_PATTERN.split(fragment))
 
-        if stats["views"] is None:
-            match = views_pattern.search(text)
-            if match:
-                stats["views"] = parse_int(match.group(1))
 
-    return stats
+def parse_anchor(fragment: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Return (text, href) of the first anchor in an HTML fragment."""
+    match = ANCHOR_PATTERN.search(fragment)
+    if not match:
+        return None
+    href_match = HREF_PATTERN.search(match.group(1))
+    href = unescape(href_match.group(1) or href_match.group(2)) if href_match else None
+    return fragment_text(match.group(2)), href
+
+
+def find_commons_file_anchor(fragment: str) -> Optional[Tuple[str, str]]:
+    """Return (text, href) of the first anchor linking to a Commons file page."""
+    for match in ANCHOR_PATTERN.finditer(fragment):
+        href_match = HREF_PATTERN.search(match.group(1))
+        if not href_match:
+            continue
+        href = unescape(href_match.group(1) or href_match.group(2))
+        if COMMONS_FILE_URL_MARKER in href:
+            return fragment_text(match.group(2)), href
+    return None
 
 
 def extract_file_entries_from_html(html: str) -> List[Dict[str, Any]]:
-    """Extract media entries (title, url, views, usages) from the HTML table."""
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.select_one("#output table.table-striped")
+    """Extract media entries (title, url, views, usages) from the HTML table.
+
+    The GLAM Tools table is flat (a file row followed by its usage rows), so the
+    rows are scanned with compiled regular expressions. BeautifulSoup is only
+    used as a fallback when the scan does not find any file rows.
+    """
+    output_start = find_output_start(html)
+    if output_start is None:
+        return extract_file_entries_with_soup(html)
+
+    # Only the striped table inside #output holds results; other tables may precede it
+    table_match = RESULT_TABLE_START_PATTERN.search(html, output_start)
+    if not table_match:
+        return extract_file_entries_with_soup(html)
+
+    table_end = RESULT_TABLE_END_PATTERN.search(html, table_match.end())
+    table_html = html[table_match.end() : table_end.start() if table_end else len(html)]
+
+    files: List[Dict[str, Any]] = []
+    current_file: Optional[Dict[str, Any]] = None
+
+    for row_match in TABLE_ROW_PATTERN.finditer(table_html):
+        row_html = row_match.group(1)
+        file_link = find_commons_file_anchor(row_html)
+        if not file_link:
+            if not current_file:
+                continue
+
+            cells = [
+                cell.group(2)
+                for cell in TABLE_CELL_PATTERN.finditer(row_html)
+                if cell.group(1).lower() == "td"
+            ]
+            if len(cells) < 2:
+                continue
+
+            wiki = fragment_text(cells[0])
+            page_link = parse_anchor(cells[1])
+            page_title = page_link[0] if page_link else fragment_text(cells[1])
+            if not wiki and not page_title:
+                continue
+
+            usage: Dict[str, Any] = {
+                "wiki": wiki,
+                "title": page_title,
+            }
+            if page_link and page_link[1]:
+                usage["url"] = page_link[1]
+
+            if len(cells) >= 3:
+                views_value = parse_int(fragment_text(cells[2]))
+                if views_value is not None:
+                    usage["views"] = views_value
+
+            current_file.setdefault("usages", []).append(usage)
+            continue
+
+        cells = [cell.group(2) for cell in TABLE_CELL_PATTERN.finditer(row_html)]
+        views: Optional[int] = None
+        if len(cells) >= 3:
+            views = parse_int(fragment_text(cells[2]))
+
+        current_file = {
+            "title": file_link[0],
+            "url": file_link[1],
+            "views": views,
+            "usages": [],
+        }
+        files.append(current_file)
+
+    if not files:
+        return extract_file_entries_with_soup(html)
+    return files
+
+
+def node_text(node) -> str:
+    """Return stripped text of a tag, reading .string directly for single-text nodes."""
+    string = node.string
+    if string is not None:
+        return string.strip()
+    return node.get_text(strip=True)
+
+
+def extract_file_entries_with_soup(html: str) -> List[Dict[str, Any]]:
+    """Extract media entries from the HTML table using BeautifulSoup."""
+    soup = BeautifulSoup(html, "lxml", parse_only=OUTPUT_CONTAINER_STRAINER)
+    table = soup.select_one("table.table-striped")
     files: List[Dict[str, Any]] = []
 
     if not table:
@@ -161,9 +430,7 @@ def extract_file_entries_from_html(html: str) -> List[Dict[str, Any]]:
     current_file: Optional[Dict[str, Any]] = None
 
     for row in table.find_all("tr"):
-        file_link = row.find(
-            "a", href=lambda href: href and "commons.wikimedia.org/wiki/File" in href
-        )
+        file_link = row.select_one(COMMONS_FILE_LINK_SELECTOR)
         if not file_link:
             if not current_file:
                 continue
@@ -172,10 +439,10 @@ def extract_file_entries_from_html(html: str) -> List[Dict[str, Any]]:
             if len(cells) < 2:
                 continue
 
-            wiki = cells[0].get_text(strip=True)
+            wiki = node_text(cells[0])
             page_cell = cells[1]
             page_link = page_cell.find("a")
-            page_title = page_link.get_text(strip=True) if page_link else page_cell.get_text(strip=True)
+            page_title = node_text(page_link) if page_link else node_text(page_cell)
             if not wiki and not page_title:
                 continue
 
@@ -187,8 +454,7 @@ def extract_file_entries_from_html(html: str) -> List[Dict[str, Any]]:
                 usage["url"] = page_link.get("href")
 
             if len(cells) >= 3:
-                views_text = cells[2].get_text(strip=True)
-                views_value = parse_int(views_text)
+                views_value = parse_int(node_text(cells[2]))
                 if views_value is not None:
                     usage["views"] = views_value
 
@@ -198,10 +464,10 @@ def extract_file_entries_from_html(html: str) -> List[Dict[str, Any]]:
         cells = row.find_all(["td", "th"])
         views: Optional[int] = None
         if len(cells) >= 3:
-            views = parse_int(cells[2].get_text(strip=True))
+            views = parse_int(node_text(cells[2]))
 
         current_file = {
-            "title": file_link.get_text(strip=True),
+            "title": node_text(file_link),
             "url": file_link.get("href"),
             "views": views,
             "usages": [],
@@ -212,36 +478,128 @@ def extract_file_entries_from_html(html: str) -> List[Dict[str, Any]]:
 
 
 def load_report_data(report_dir: Path) -> Optional[Dict[str, Any]]:
-    """Load stored metadata and derived data for a report directory."""
-    if not report_dir.is_dir():
+    """Load report data if report_dir is a directory."""
+    try:
+        dir_stat = report_dir.stat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(dir_stat.st_mode):
         return None
+    return read_report_data(report_dir)
 
-    metadata_path = next(iter(sorted(report_dir.glob("metadata_*.json"))), None)
+
+def get_report_index() -> Dict[str, Any]:
+    """Return the on-disk index of HTML-parsed reports, loading it on first use."""
+    global REPORT_INDEX
+    with REPORT_INDEX_LOCK:
+        if REPORT_INDEX is None:
+            try:
+                stored = orjson.loads(read_file_bytes(REPORT_INDEX_PATH))
+            except (orjson.JSONDecodeError, OSError):
+                stored = None
+            if isinstance(stored, dict) and stored.get("version") == REPORT_INDEX_VERSION:
+                REPORT_INDEX = stored.get("reports") or {}
+            else:
+                REPORT_INDEX = {}
+        return REPORT_INDEX
+
+
+def save_report_index() -> None:
+    """Write the report index back to disk if entries were added."""
+    if REPORT_INDEX is None or not REPORT_INDEX_DIRTY:
+        return
+    try:
+        REPORT_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        REPORT_INDEX_PATH.write_bytes(
+            orjson.dumps({"version": REPORT_INDEX_VERSION, "reports": REPORT_INDEX})
+        )
+    except OSError as exc:
+        log(f"Note: Could not write report index {REPORT_INDEX_PATH}: {exc}")
+
+
+atexit.register(save_report_index)
+
+
+def file_signature(path: Optional[Path]) -> Optional[List[Any]]:
+    """Return [name, mtime_ns, size] identifying the current state of a file."""
+    if path is None:
+        return None
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return None
+    return [path.name, file_stat.st_mtime_ns, file_stat.st_size]
+
+
+def parse_report_html(
+    html_path: Path,
+    metadata_path: Optional[Path],
+    summary: Optional[Dict[str, Any]],
+    files: Optional[List[Dict[str, Any]]],
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
+    """Complete summary/files from the results HTML, reusing the on-disk index."""
+    global REPORT_INDEX_DIRTY
+    signature = [file_signature(html_path), file_signature(metadata_path)]
+    if signature[0] is None:
+        return summary, files
+
+    index = get_report_index()
+    key = html_path.parent.as_posix()
+    entry = index.get(key)
+    if entry and entry.get("signature") == signature and not REPARSE_REPORT_HTML:
+        return entry["summary"], entry["files"]
+
+    try:
+        html_content = read_file_bytes(html_path).decode("utf-8")
+    except OSError:
+        return summary, files
+
+    if not summary:
+        summary = extract_summary_stats_from_html(html_content)
+    parsed_files = extract_file_entries_from_html(html_content)
+    if parsed_files:
+        files = parsed_files
+
+    index[key] = {"signature": signature, "summary": summary, "files": files}
+    REPORT_INDEX_DIRTY = True
+    return summary, files
+
+
+def read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with a single open/fstat/read and no buffered wrapper."""
+    # O_BINARY keeps Windows from translating CRLF or stopping at 0x1A
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def read_report_data(report_dir: Path) -> Dict[str, Any]:
+    """Load stored metadata and derived data for a report directory."""
+    metadata_path = min(report_dir.glob("metadata_*.json"), default=None)
     metadata: Dict[str, Any] = {}
     if metadata_path and metadata_path.exists():
         try:
-            with metadata_path.open("r", encoding="utf-8") as f:
-                metadata = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            metadata = orjson.loads(read_file_bytes(metadata_path))
+        except (orjson.JSONDecodeError, OSError):
             metadata = {}
 
-    html_path = next(iter(sorted(report_dir.glob("glamtools_results_*.html"))), None)
-    html_content = ""
-    if html_path and html_path.exists():
-        try:
-            html_content = html_path.read_text(encoding="utf-8")
-        except OSError:
-            html_content = ""
-
     summary = metadata.get("summary")
     files = metadata.get("files")
+    # Reports written by save_results store both; only older ones need the HTML
+    needs_html = REPARSE_REPORT_HTML or not (summary and files)
 
-    if html_content:
-        if not summary:
-            summary = extract_summary_stats_from_html(html_content)
-        parsed_files = extract_file_entries_from_html(html_content)
-        if parsed_files:
-            files = parsed_files
+    html_path = min(report_dir.glob("glamtools_results_*.html"), default=None)
+    if needs_html and html_path:
+        summary, files = parse_report_html(html_path, metadata_path, summary, files)
 
     timestamp = metadata.get("timestamp")
     if not timestamp:
@@ -273,37 +631,42 @@ def parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
             return None
 
 
-def get_latest_report() -> Optional[Dict[str, Any]]:
-    """Return information about the most recent report directory."""
-    if not BASE_OUTPUT_DIR.exists():
-        return None
+def build_query(config: CategoryConfig) -> GlamQuery:
+    """Return the GLAM Tools query for a category and the target month."""
+    return GlamQuery(category=config.name, depth=DEPTH, year=YEAR, month=MONTH)
 
-    latest_report: Optional[Dict[str, Any]] = None
-    latest_timestamp: Optional[datetime] = None
 
-    for entry in BASE_OUTPUT_DIR.iterdir():
-        if not entry.is_dir():
-            continue
+def scan_reports(base_output_dir: Path) -> List[Dict[str, Any]]:
+    """Load all report directories below base_output_dir, oldest first."""
+    if not base_output_dir.exists():
+        return []
 
-        data = load_report_data(entry)
+    entries = list(base_output_dir.iterdir())
+    if not entries:
+        return []
+
+    # Load the index before fanning out so the workers share one dict
+    get_report_index()
+    with ThreadPoolExecutor(max_workers=min(REPORT_SCAN_WORKERS, len(entries))) as executor:
+        loaded = list(executor.map(load_report_data, entries))
+
+    dated_reports: List[Tuple[datetime, Dict[str, Any]]] = []
+    for data in loaded:
         if not data:
             continue
 
-        ts = parse_timestamp(data.get("timestamp"))
-        if ts is None:
-            try:
-                ts = datetime.fromtimestamp(entry.stat().st_mtime, timezone.utc)
-            except OSError:
-                ts = None
-
+        ts = get_report_datetime(data)
         if ts is None:
             continue
+        dated_reports.append((ts, data))
 
-        if latest_timestamp is None or ts > latest_timestamp:
-            latest_timestamp = ts
-            latest_report = data
+    dated_reports.sort(key=lambda item: item[0])
+    return [data for _, data in dated_reports]
 
-    return latest_report
+
+def get_latest_report(reports: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return information about the most recent report directory."""
+    return reports[-1] if reports else None
 
 
 def get_report_datetime(report: Dict[str, Any]) -> Optional[datetime]:
@@ -327,21 +690,34 @@ def get_report_datetime(report: Dict[str, Any]) -> Optional[datetime]:
     return None
 
 
-def find_earliest_report_for_month(year: int, month: int) -> Optional[Dict[str, Any]]:
-    """Return the earliest stored report for the given dataset month."""
-    if not BASE_OUTPUT_DIR.exists():
+def find_cached_report(
+    query: GlamQuery, report: Optional[Dict[str, Any]], now: datetime
+) -> Optional[Dict[str, Any]]:
+    """Return report if it answers query and is younger than RUN_CACHE_TTL."""
+    if FORCE_REFRESH or not report:
         return None
 
-    candidates: List[Dict[str, Any]] = []
+    metadata = report.get("metadata") or {}
+    stored_query = (
+        metadata.get("category"),
+        metadata.get("depth"),
+        metadata.get("year"),
+        metadata.get("month"),
+    )
+    if stored_query != (query.category, query.depth, query.year, query.month):
+        return None
 
-    for entry in BASE_OUTPUT_DIR.iterdir():
-        if not entry.is_dir():
-            continue
+    ts = parse_timestamp(metadata.get("timestamp"))
+    if ts is None or ts.tzinfo is None:
+        return None
+    return report if timedelta(0) <= now - ts < RUN_CACHE_TTL else None
 
-        data = load_report_data(entry)
-        if not data:
-            continue
 
+def find_earliest_report_for_month(
+    year: int, month: int, reports: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Return the earliest stored report for the given dataset month."""
+    for data in reports:
         metadata = data.get("metadata") or {}
 
         try:
@@ -351,14 +727,9 @@ def find_earliest_report_for_month(year: int, month: int) -> Optional[Dict[str,
             continue
 
         if metadata_year == year and metadata_month == month:
-            candidates.append(data)
-
-    if not candidates:
-        return None
+            return data
 
-    far_future = datetime.max.replace(tzinfo=timezone.utc)
-    candidates.sort(key=lambda item: get_report_datetime(item) or far_future)
-    return candidates[0]
+    return None
 
 
 def format_diff(value: int) -> str:
@@ -409,15 +780,14 @@ def calculate_summary_differences(
     return diffs
 
 
-def build_usage_lookup_from_files(
-    files: List[Dict[str, Any]],
-) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
-    """Create a lookup of page-usage entries for quick diffing.
+def iter_usage_entries(
+    files: Iterable[Dict[str, Any]],
+) -> Iterator[Tuple[Tuple[str, str, str, str], Dict[str, Any]]]:
+    """Yield (key, details) pairs for every page usage in a file list.
 
     Keyed by (wiki, page_title, page_url, media_url) to uniquely identify a usage.
     Values contain display-friendly fields.
     """
-    lookup: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
     for item in files or []:
         media_url = (item or {}).get("url") or ""
         media_title = (item or {}).get("title") or media_url
@@ -433,19 +803,25 @@ def build_usage_lookup_from_files(
                 # Skip empty rows
                 continue
             key = (wiki, page_title, page_url, media_url)
-            lookup[key] = {
+            yield key, {
                 "wiki": wiki or "unknown",
                 "page_title": page_title or "unknown",
                 "page_url": page_url,
                 "media_title": media_title,
                 "media_url": media_url,
             }
-    return lookup
+
+
+def build_usage_lookup_from_files(
+    files: Iterable[Dict[str, Any]],
+) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+    """Create a lookup of page-usage entries for quick diffing."""
+    return dict(iter_usage_entries(files))
 
 
 def compute_usage_change_details(
-    previous_files: List[Dict[str, Any]],
-    current_files: List[Dict[str, Any]],
+    previous_files: Iterable[Dict[str, Any]],
+    current_files: Iterable[Dict[str, Any]],
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Compute detailed page-usage changes between two file lists.
 
@@ -455,9 +831,6 @@ def compute_usage_change_details(
     prev_lookup = build_usage_lookup_from_files(previous_files)
     curr_lookup = build_usage_lookup_from_files(current_files)
 
-    added_keys = set(curr_lookup) - set(prev_lookup)
-    removed_keys = set(prev_lookup) - set(curr_lookup)
-
     def sort_usage(details: Dict[str, Any]) -> Tuple[str, str, str]:
         return (
             details.get("wiki") or "",
@@ -465,19 +838,55 @@ def compute_usage_change_details(
             details.get("media_title") or "",
         )
 
-    added = sorted((curr_lookup[k] for k in added_keys), key=sort_usage)
-    removed = sorted((prev_lookup[k] for k in removed_keys), key=sort_usage)
+    added = sorted(
+        (details for key, details in curr_lookup.items() if key not in prev_lookup),
+        key=sort_usage,
+    )
+    removed = sorted(
+        (details for key, details in prev_lookup.items() if key not in curr_lookup),
+        key=sort_usage,
+    )
     return added, removed
 
 
+def get_files_by_url(report: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Return the report's files keyed by URL, building the mapping once per report."""
+    files_by_url = report.get("_files_by_url")
+    if files_by_url is None:
+        files_by_url = {
+            item.get("url"): item
+            for item in (report.get("files", []) or [])
+            if item.get("url")
+        }
+        report["_files_by_url"] = files_by_url
+    return files_by_url
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hardlink target to source, copying the file where hardlinks are unsupported."""
+    try:
+        target.unlink(missing_ok=True)
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
 def save_screenshot_at_top(driver: webdriver.Chrome, path: Path) -> None:
-    """Scroll to the top of the page before capturing a screenshot."""
+    """Scroll to the top of the page before capturing a JPEG screenshot."""
     try:
         driver.execute_script("window.scrollTo(0, 0);")
         time.sleep(0.5)
     except Exception as exc:
-        print(f"Note: Could not scroll to top before screenshot: {exc}")
-    driver.save_screenshot(str(path))
+        log(f"Note: Could not scroll to top before screenshot: {exc}")
+    result = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {
+            "format": "jpeg",
+            "quality": SCREENSHOT_JPEG_QUALITY,
+            "captureBeyondViewport": False,
+        },
+    )
+    path.write_bytes(base64.b64decode(result["data"]))
 
 
 def write_comparison_summary(
@@ -530,20 +939,16 @@ def write_comparison_summary(
     current_pages_total = current_summary.get("pages_used")
     current_pages_display = current_pages_total if current_pages_total is not None else "unknown"
 
-    previous_files_by_url = {
-        item.get("url"): item
-        for item in (previous_report.get("files", []) or [])
-        if item.get("url")
-    }
+    previous_files_by_url = get_files_by_url(previous_report)
     current_files_by_url = {
         item.get("url"): item for item in (current_files or []) if item.get("url")
     }
 
-    added_urls = sorted(set(current_files_by_url) - set(previous_files_by_url))
-    removed_urls = sorted(set(previous_files_by_url) - set(current_files_by_url))
+    added_urls = sorted(current_files_by_url.keys() - previous_files_by_url.keys())
+    removed_urls = sorted(previous_files_by_url.keys() - current_files_by_url.keys())
 
     added_usage_details, removed_usage_details = compute_usage_change_details(
-        list(previous_files_by_url.values()), list(current_files_by_url.values())
+        previous_files_by_url.values(), current_files_by_url.values()
     )
 
     page_usage_changes_present = bool(added_usage_details or removed_usage_details)
@@ -645,60 +1050,107 @@ def create_monthly_comparison_file(
     )
 
 
-def setup_driver(headless=True):
+def setup_driver(headless=True, profile_dir: Optional[Path] = CHROME_PROFILE_DIR):
     """Setup Chrome driver with options"""
     chrome_options = Options()
+    if profile_dir:
+        # Reuse DNS/TLS state and the HTTP cache for the GLAM Tools assets across runs
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument(f"--disk-cache-dir={profile_dir / 'cache'}")
+        chrome_options.add_argument("--profile-directory=Default")
     if headless:
-        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
+    # GLAM Tools results are text/tables only; skip extensions, background
+    # traffic and image decoding
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    # Only one trusted origin is visited, so per-site renderer processes buy nothing
+    chrome_options.add_argument(
+        "--disable-features=IsolateOrigins,SitePerProcess,Translate,BackForwardCache"
+    )
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        },
+    )
     
     driver = webdriver.Chrome(options=chrome_options)
+    # Waiting is done with explicit WebDriverWaits only, so find_element must not block
+    driver.implicitly_wait(0)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+    except WebDriverException as exc:
+        log(f"Note: Could not block static resources: {exc}")
+    if profile_dir:
+        clear_site_data(driver)
     return driver
 
 
-def fill_form_and_submit(driver):
+def clear_site_data(driver: webdriver.Chrome) -> None:
+    """Remove cookies and GLAM Tools site storage left in a persistent profile."""
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin",
+            {"origin": GLAMTOOLS_ORIGIN, "storageTypes": CLEARED_STORAGE_TYPES},
+        )
+    except WebDriverException as exc:
+        log(f"Note: Could not clear stored site data: {exc}")
+
+
+def fill_form_and_submit(driver, query: GlamQuery):
     """Fill the GLAM Tools form and submit"""
-    print(f"Opening {GLAMTOOLS_URL}")
+    log(f"Opening {GLAMTOOLS_URL}")
     driver.get(GLAMTOOLS_URL)
     
     # Wait for page to load
     wait = WebDriverWait(driver, 30)
     
     # Fill in the category
-    print(f"Filling category: {CATEGORY}")
+    log(f"Filling category: {query.category}")
     category_input = wait.until(
         EC.presence_of_element_located((By.ID, "category"))
     )
     category_input.clear()
-    category_input.send_keys(CATEGORY)
+    category_input.send_keys(query.category)
     
     # Fill in the depth
-    print(f"Setting depth: {DEPTH}")
+    log(f"Setting depth: {query.depth}")
     depth_input = driver.find_element(By.ID, "depth")
     depth_input.clear()
-    depth_input.send_keys(DEPTH)
+    depth_input.send_keys(query.depth)
     
     # Fill in year (it's an input, not a select)
-    print(f"Setting year: {YEAR}")
+    log(f"Setting year: {query.year}")
     year_input = driver.find_element(By.ID, "year")
     year_input.clear()
-    year_input.send_keys(YEAR)
+    year_input.send_keys(query.year)
     
     # Fill in month (it's an input, not a select)
-    print(f"Setting month: {MONTH_FOR_FORM}")
+    log(f"Setting month: {query.month_for_form}")
     month_input = driver.find_element(By.ID, "month")
     month_input.clear()
-    month_input.send_keys(MONTH_FOR_FORM)
+    month_input.send_keys(query.month_for_form)
     
     # Submit the form
-    print("Submitting form...")
+    log("Submitting form...")
     submit_button = driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
     submit_button.click()
     
-    print("Form submitted, waiting for results...")
+    log("Form submitted, waiting for results...")
 
 
 def wait_for_results(
@@ -708,25 +1160,30 @@ def wait_for_results(
     initial_wait_seconds: int,
 ) -> None:
     """Wait for the results to load with a configurable timeout."""
-    print(
+    log(
         f"Waiting for results to load (timeout {max_wait_seconds}s, initial wait {initial_wait_seconds}s)..."
     )
 
     if initial_wait_seconds:
-        time.sleep(initial_wait_seconds)
+        # Upper bound only: continue as soon as GLAM Tools reports progress or rows exist
+        try:
+            # Script errors while the page settles after submit just mean "not yet"
+            WebDriverWait(
+                driver,
+                initial_wait_seconds,
+                poll_frequency=0.5,
+                ignored_exceptions=(WebDriverException,),
+            ).until(lambda d: d.execute_script(RESULTS_STARTED_SCRIPT, RESULT_ROW_SELECTOR))
+        except TimeoutException:
+            pass
 
     start_time = time.time()
     deadline = start_time + max_wait_seconds
-    last_content_length = 0
+    last_row_count = 0
     stable_count = 0
     found_table = False
     found_category_line = False
-
-    def read_status_text() -> str:
-        try:
-            return driver.find_element(By.ID, "status").text.strip()
-        except Exception:
-            return ""
+    status_text = ""
 
     def has_loading_status(status_text: str) -> bool:
         return bool(
@@ -734,78 +1191,89 @@ def wait_for_results(
             or re.search(r"pages\s+to\s+go\.\.\.", status_text, re.IGNORECASE)
         )
 
-    def has_result_table() -> bool:
-        selectors = [
-            "#output table.table.table-striped",
-            "#output table.table-striped",
-            "#output .table-striped",
-        ]
-        for selector in selectors:
-            try:
-                if driver.find_elements(By.CSS_SELECTOR, selector):
-                    return True
-            except Exception:
-                continue
-        return False
-
-    def visible_output_text() -> str:
+    def read_probe(driver_instance) -> Dict[str, Any]:
         try:
-            output = driver.find_element(By.ID, "output")
-            return output.text or ""
-        except Exception:
-            return ""
-
-    while time.time() < deadline:
-        output_text = visible_output_text()
-        current_content = driver.page_source
-        current_length = len(current_content)
+            return driver_instance.execute_script(
+                RESULTS_PROBE_SCRIPT,
+                RESULT_CATEGORY_LINE_PATTERN.pattern,
+                RESULT_VIEWS_PATTERN.pattern,
+                RESULT_ROW_SELECTOR,
+            ) or {}
+        except WebDriverException:
+            return {}
+
+    def results_stable(driver_instance) -> bool:
+        nonlocal last_row_count, stable_count, found_table, found_category_line
+        nonlocal status_text
+
+        probe = read_probe(driver_instance)
+        row_count = int(probe.get("rowCount") or 0)
         elapsed = int(time.time() - start_time)
-        status_text = read_status_text()
+        status_text = (probe.get("status") or "").strip()
         loading_active = has_loading_status(status_text)
 
-        has_category_msg = bool(RESULT_CATEGORY_LINE_PATTERN.search(output_text))
-        has_views_data = bool(RESULT_VIEWS_PATTERN.search(output_text))
-        has_table = has_result_table()
+        has_category_msg = bool(probe.get("hasCategoryLine"))
+        has_views_data = bool(probe.get("hasViews"))
+        has_table = bool(probe.get("hasTable"))
 
         if has_category_msg and not found_category_line:
-            print(f"✓ Found result category line ({elapsed}s)")
+            log(f"✓ Found result category line ({elapsed}s)")
             found_category_line = True
 
         if has_category_msg and has_views_data and has_table and not loading_active:
             if not found_table:
-                print(f"✓ Found table with view data ({elapsed}s)")
+                log(f"✓ Found table with view data ({elapsed}s)")
                 found_table = True
 
-            if current_length == last_content_length:
+            if row_count == last_row_count:
                 stable_count += 1
                 if stable_count >= STABILIZATION_CHECKS:
-                    print(f"✓ Content stabilized ({elapsed}s)")
-                    return
+                    log(f"✓ Content stabilized ({elapsed}s)")
+                    return True
             else:
                 stable_count = 0
-                last_content_length = current_length
+                last_row_count = row_count
                 if elapsed % 8 == 0:
-                    print(f"  Still loading... ({current_length} bytes, {elapsed}s)")
+                    log(f"  Still loading... ({row_count} rows, {elapsed}s)")
         else:
             stable_count = 0
-            last_content_length = current_length
+            last_row_count = row_count
             if elapsed % 5 == 0:
                 loading_note = f"; status='{status_text}'" if status_text else ""
-                print(f"  Waiting for table... ({elapsed}s{loading_note})")
+                log(f"  Waiting for table... ({elapsed}s{loading_note})")
 
-        time.sleep(1)
+        return False
 
-    status_text = read_status_text()
-    raise TimeoutException(
-        "Timed out after "
-        f"{max_wait_seconds}s waiting for GLAM Tools results (status: '{status_text or 'n/a'}')."
-    )
+    try:
+        # Cheap element lookup until the first result row exists, then the full probe
+        WebDriverWait(
+            driver, max_wait_seconds, poll_frequency=TABLE_PRESENCE_POLL_SECONDS
+        ).until(EC.presence_of_element_located((By.CSS_SELECTOR, RESULT_ROW_SELECTOR)))
+        log(f"✓ Found result table rows ({int(time.time() - start_time)}s)")
+
+        remaining_seconds = max(deadline - time.time(), 1)
+        WebDriverWait(driver, remaining_seconds, poll_frequency=1).until(results_stable)
+    except TimeoutException:
+        if not status_text:
+            try:
+                status_text = driver.find_element(By.ID, "status").text.strip()
+            except WebDriverException:
+                status_text = ""
+        raise TimeoutException(
+            "Timed out after "
+            f"{max_wait_seconds}s waiting for GLAM Tools results (status: '{status_text or 'n/a'}')."
+        ) from None
+
+
+def page_contains(driver, text: str) -> bool:
+    """Check in the browser whether the current page markup contains text."""
+    return bool(driver.execute_script(PAGE_CONTAINS_SCRIPT, text))
 
 
 def expand_full_results(driver):
     """Attempt to expand the report to show all files."""
     try:
-        if "Showing only the top" not in driver.page_source:
+        if not page_contains(driver, "Showing only the top"):
             return
 
         show_all_link = WebDriverWait(driver, 10).until(
@@ -814,26 +1282,32 @@ def expand_full_results(driver):
             )
         )
         show_all_link.click()
-        print("Expanding to show all files...")
+        log("Expanding to show all files...")
 
         def expanded(driver_instance):
-            return "Showing only the top" not in driver_instance.page_source
+            return not page_contains(driver_instance, "Showing only the top")
 
         WebDriverWait(driver, 30).until(expanded)
         time.sleep(2)
-        print("✓ Expanded to full file list")
+        log("✓ Expanded to full file list")
     except Exception as e:
-        print(f"Note: Could not expand to full file list: {e}")
+        log(f"Note: Could not expand to full file list: {e}")
 
 
-def save_results(driver, previous_report: Optional[Dict[str, Any]]):
+def save_results(
+    driver,
+    query: GlamQuery,
+    base_output_dir: Path,
+    page_source: str,
+    previous_report: Optional[Dict[str, Any]],
+    reference_report: Optional[Dict[str, Any]] = None,
+):
     """Save the results in various formats and annotate with differences."""
-    BASE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    base_dir_name = f"{YEAR}-{MONTH.zfill(2)}_{timestamp}"
+    now_utc = datetime.now(timezone.utc)
+    now_iso = now_utc.isoformat()
+    timestamp = now_utc.strftime("%Y%m%d_%H%M%S")
+    base_dir_name = f"{query.year}-{query.month.zfill(2)}_{timestamp}"
 
-    page_source = driver.page_source
     summary_stats = extract_summary_stats_from_html(page_source)
     file_entries = extract_file_entries_from_html(page_source)
 
@@ -845,71 +1319,55 @@ def save_results(driver, previous_report: Optional[Dict[str, Any]]):
     total_usage_changes = len(added_usage_details) + len(removed_usage_details)
     diff_label = f"[{total_usage_changes}]"
     final_dir_name = f"{base_dir_name}_{diff_label}"
-    output_dir = BASE_OUTPUT_DIR / final_dir_name
+    output_dir = base_output_dir / final_dir_name
     output_dir.mkdir(parents=True, exist_ok=False)
 
     html_file = output_dir / f"glamtools_results_{timestamp}.html"
     html_file.write_text(page_source, encoding="utf-8")
-    print(f"Saved HTML: {html_file}")
+    log(f"Saved HTML: {html_file}")
 
-    screenshot_file = output_dir / f"glamtools_screenshot_{timestamp}.png"
+    screenshot_file = output_dir / f"glamtools_screenshot_{timestamp}.jpg"
     save_screenshot_at_top(driver, screenshot_file)
-    print(f"Saved screenshot: {screenshot_file}")
+    log(f"Saved screenshot: {screenshot_file}")
 
-    table_data = []
-    try:
-        tables = driver.find_elements(By.TAG_NAME, "table")
-        for table in tables:
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if not cells:
-                    cells = row.find_elements(By.TAG_NAME, "th")
-                row_data = [cell.text for cell in cells]
-                if row_data:
-                    table_data.append(row_data)
-    except Exception as e:
-        print(f"Note: Could not extract table data: {e}")
-
-    if table_data:
-        json_file = output_dir / f"glamtools_data_{timestamp}.json"
-        json_file.write_text(
-            json.dumps(
-                {
-                    "category": CATEGORY,
-                    "depth": DEPTH,
-                    "year": YEAR,
-                    "month": MONTH,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "summary": summary_stats,
-                    "files": file_entries,
-                    "table_data": table_data,
-                },
-                indent=2,
-                ensure_ascii=False,
-            ),
-            encoding="utf-8",
+    # The structured file entries already hold every table row, so no raw table dump
+    json_file = output_dir / f"glamtools_data_{timestamp}.json"
+    json_file.write_bytes(
+        orjson.dumps(
+            {
+                "category": query.category,
+                "depth": query.depth,
+                "year": query.year,
+                "month": query.month,
+                "timestamp": now_iso,
+                "summary": summary_stats,
+                "files": file_entries,
+            },
+            option=orjson.OPT_INDENT_2,
         )
-        print(f"Saved JSON data: {json_file}")
+    )
+    log(f"Saved JSON data: {json_file}")
 
     latest_html = output_dir / "latest.html"
-    latest_html.write_text(page_source, encoding="utf-8")
+    link_or_copy(html_file, latest_html)
 
-    latest_screenshot = output_dir / "latest_screenshot.png"
-    save_screenshot_at_top(driver, latest_screenshot)
+    # Same page state as the timestamped screenshot, so link it instead of capturing again
+    latest_screenshot = output_dir / "latest_screenshot.jpg"
+    if screenshot_file.exists():
+        link_or_copy(screenshot_file, latest_screenshot)
 
     current_url = driver.current_url
-    print(f"Current URL: {current_url}")
+    log(f"Current URL: {current_url}")
 
     previous_summary = previous_report.get("summary", {}) if previous_report else {}
     summary_differences = calculate_summary_differences(summary_stats, previous_summary)
 
     metadata = {
-        "category": CATEGORY,
-        "depth": DEPTH,
-        "year": YEAR,
-        "month": MONTH,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "category": query.category,
+        "depth": query.depth,
+        "year": query.year,
+        "month": query.month,
+        "timestamp": now_iso,
         "url": current_url,
         "page_title": driver.title,
         "summary": summary_stats,
@@ -928,16 +1386,13 @@ def save_results(driver, previous_report: Optional[Dict[str, Any]]):
     }
 
     metadata_file = output_dir / f"metadata_{timestamp}.json"
-    metadata_file.write_text(json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"Saved metadata: {metadata_file}")
+    metadata_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    log(f"Saved metadata: {metadata_file}")
 
     if previous_report:
         create_changes_summary_file(output_dir, summary_stats, previous_report, file_entries)
 
     if IS_FIRST_DAY_OF_MONTH:
-        reference_report = find_earliest_report_for_month(
-            PREVIOUS_DATASET_YEAR, PREVIOUS_DATASET_MONTH
-        )
         if reference_report:
             reference_label = (
                 f"{PREVIOUS_DATASET_YEAR}-{str(PREVIOUS_DATASET_MONTH).zfill(2)}"
@@ -946,7 +1401,7 @@ def save_results(driver, previous_report: Optional[Dict[str, Any]]):
                 output_dir, summary_stats, file_entries, reference_report, reference_label
             )
         else:
-            print(
+            log(
                 "No stored report found for the previous dataset month; skipping monthly summary."
             )
 
@@ -954,102 +1409,155 @@ def save_results(driver, previous_report: Optional[Dict[str, Any]]):
 
 
 def run_category(
-    config: CategoryConfig, driver: webdriver.Chrome
-) -> Tuple[CategoryConfig, Path, int]:
+    config: CategoryConfig,
+    reports: List[Dict[str, Any]],
+    get_driver: Callable[[], webdriver.Chrome],
+    run_stamp: str,
+) -> CategoryRunResult:
     """Execute the GLAM Tools check for a single category."""
 
-    global CATEGORY, BASE_OUTPUT_DIR
-
-    CATEGORY = config.name
-    BASE_OUTPUT_DIR = REPORTS_ROOT / config.report_subdir
+    query = build_query(config)
+    base_output_dir = config.output_dir
+    driver: Optional[webdriver.Chrome] = None
 
     separator = "=" * 80
-    print(f"\n{separator}")
-    print(f"Processing category: {CATEGORY}")
-    print(separator)
+    log(f"\n{separator}")
+    log(f"Processing category: {query.category}")
+    log(separator)
 
     try:
-        print("Starting GLAM Tools browser automation...")
-        print(f"Category: {CATEGORY}")
-        print(f"Depth: {DEPTH}")
-        print(f"Year/Month: {YEAR}/{MONTH}\n")
+        log("Starting GLAM Tools browser automation...")
+        log(f"Category: {query.category}")
+        log(f"Depth: {query.depth}")
+        log(f"Year/Month: {query.year}/{query.month}\n")
+
+        previous_report = get_latest_report(reports)
+        cached_report = find_cached_report(
+            query, previous_report, datetime.now(timezone.utc)
+        )
+        if cached_report:
+            log(
+                f"Reusing report from {cached_report['metadata']['timestamp']} "
+                f"(younger than {RUN_CACHE_TTL}): {cached_report['path']}/"
+            )
+            return CategoryRunResult.for_report(config, cached_report["path"], 0)
 
-        previous_report = get_latest_report()
-        fill_form_and_submit(driver)
+        reference_report = (
+            find_earliest_report_for_month(
+                PREVIOUS_DATASET_YEAR, PREVIOUS_DATASET_MONTH, reports
+            )
+            if IS_FIRST_DAY_OF_MONTH
+            else None
+        )
+        driver = get_driver()
+        fill_form_and_submit(driver, query)
         wait_for_results(
             driver,
             max_wait_seconds=config.max_wait_seconds,
             initial_wait_seconds=config.initial_wait_seconds,
         )
         expand_full_results(driver)
-        output_dir, total_usage_changes = save_results(driver, previous_report)
+        page_source = driver.page_source
+        output_dir, total_usage_changes = save_results(
+            driver, query, base_output_dir, page_source, previous_report, reference_report
+        )
 
-        print(f"\n✓ Process completed successfully for {CATEGORY}!")
-        print(f"Results saved to {output_dir}/")
-        print(f"Total page-usage changes in this run: {total_usage_changes}")
+        log(f"\n✓ Process completed successfully for {query.category}!")
+        log(f"Results saved to {output_dir}/")
+        log(f"Total page-usage changes in this run: {total_usage_changes}")
 
     except Exception as e:
-        print(f"\n✗ Error occurred while processing {CATEGORY}: {e}")
+        log(f"\n✗ Error occurred while processing {query.category}: {e}")
         if driver:
-            BASE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-            error_screenshot = BASE_OUTPUT_DIR / (
-                f"error_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.png"
-            )
+            error_screenshot = base_output_dir / f"error_{run_stamp}.jpg"
             try:
                 save_screenshot_at_top(driver, error_screenshot)
-                print(f"Error screenshot saved: {error_screenshot}")
+                log(f"Error screenshot saved: {error_screenshot}")
             except Exception:
                 pass
         raise
-    finally:
-        try:
-            driver.delete_all_cookies()
-        except Exception:
-            pass
-
-    return config, output_dir, total_usage_changes
 
+    return CategoryRunResult.for_report(config, output_dir, total_usage_changes)
 
-def main():
-    print("Starting GLAM Tools browser automation for configured categories...")
-    run_timestamp = datetime.now(timezone.utc).isoformat()
-    total_changes_all = 0
-    per_category: List[Dict[str, Any]] = []
 
+def run_category_in_own_browser(
+    config: CategoryConfig, reports: List[Dict[str, Any]], run_stamp: str
+) -> CategoryRunResult:
+    """Run one category with a dedicated Chrome instance and profile."""
     driver: Optional[webdriver.Chrome] = None
+    LOG_CONTEXT.label = config.label
+
+    def get_driver() -> webdriver.Chrome:
+        # Started on first use so cached categories never launch Chrome; concurrent
+        # instances cannot share a user data dir, so each category gets its own
+        nonlocal driver
+        if driver is None:
+            driver = setup_driver(headless=True, profile_dir=CHROME_PROFILE_DIR / config.label)
+        return driver
+
     try:
-        driver = setup_driver(headless=True)
-
-        for config in CATEGORY_CONFIGS:
-            cat_config, output_dir, changes = run_category(config, driver)
-            per_category.append(
-                {
-                    "name": cat_config.name,
-                    "label": cat_config.label,
-                    "report_directory": str(output_dir),
-                    "changes": int(changes),
-                }
-            )
-            total_changes_all += int(changes)
+        return run_category(config, reports, get_driver, run_stamp)
     finally:
         if driver:
             driver.quit()
-            print("Browser closed")
+            log("Browser closed")
+        LOG_CONTEXT.label = None
+
+
+def main():
+    print("Starting GLAM Tools browser automation for configured categories...")
+    run_started = datetime.now(timezone.utc)
+    run_timestamp = run_started.isoformat()
+    # Shared by all categories, e.g. for error screenshot names
+    run_stamp = run_started.strftime("%Y%m%d_%H%M%S")
+    total_changes_all = 0
+    per_category: List[CategoryRunResult] = []
+
+    for config in CATEGORY_CONFIGS:
+        config.output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Each category writes only to its own directory, so one scan up front is enough
+    reports_by_category = {
+        config.name: scan_reports(config.output_dir) for config in CATEGORY_CONFIGS
+    }
+
+    first_error: Optional[BaseException] = None
+    max_workers = min(MAX_PARALLEL_BROWSERS, len(CATEGORY_CONFIGS))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_category_in_own_browser,
+                config,
+                reports_by_category[config.name],
+                run_stamp,
+            )
+            for config in CATEGORY_CONFIGS
+        ]
+        # Let every category finish before reporting the first failure
+        for future in futures:
+            try:
+                result = future.result()
+            except Exception as exc:
+                if first_error is None:
+                    first_error = exc
+                continue
+            per_category.append(result)
+            total_changes_all += result.changes
+
+    if first_error is not None:
+        raise first_error
 
     # Persist a run-level summary for the workflow to use in commit messages
-    REPORTS_ROOT.mkdir(parents=True, exist_ok=True)
     run_summary_path = REPORTS_ROOT / "run_summary.json"
-    run_summary_path.write_text(
-        json.dumps(
+    run_summary_path.write_bytes(
+        orjson.dumps(
             {
                 "timestamp": run_timestamp,
                 "total_changes": total_changes_all,
                 "categories": per_category,
             },
-            indent=2,
-            ensure_ascii=False,
-        ),
-        encoding="utf-8",
+            option=orjson.OPT_INDENT_2,
+        )
     )
     print(
         f"Saved run summary to {run_summary_path} (total changes across all categories: {total_changes_all})"